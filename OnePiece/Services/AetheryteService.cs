@@ -20,6 +20,15 @@ public class AetheryteService : IDisposable
     private readonly IClientState clientState;
     private readonly IObjectTable objectTable;
     private List<AetheryteInfo> aetherytes = new();
+    private Dictionary<string, List<AetheryteInfo>> aetherytesByMapArea = new(StringComparer.OrdinalIgnoreCase);
+
+    // Lenient options for the bundled aetheryte.json, shared so the serializer metadata is built once
+    private static readonly JsonSerializerOptions JsonOptions = new()
+    {
+        AllowTrailingCommas = true,
+        ReadCommentHandling = JsonCommentHandling.Skip,
+        PropertyNameCaseInsensitive = true
+    };
 
     /// <summary>
     /// Initializes a new instance of the <see cref="AetheryteService"/> class.
@@ -49,7 +58,10 @@ public class AetheryteService : IDisposable
     /// <returns>A list of aetherytes in the specified map area.</returns>
     public IReadOnlyList<AetheryteInfo> GetAetherytesInMapArea(string mapArea)
     {
-        return aetherytes.Where(a => a.MapArea.Equals(mapArea, StringComparison.OrdinalIgnoreCase)).ToList();
+        if (mapArea != null && aetherytesByMapArea.TryGetValue(mapArea, out var aetherytesInMap))
+            return aetherytesInMap;
+
+        return Array.Empty<AetheryteInfo>();
     }
 
     /// <summary>
@@ -104,10 +116,9 @@ public class AetheryteService : IDisposable
     /// <returns>A set of valid map area names.</returns>
     public IReadOnlySet<string> GetValidMapAreas()
     {
-        return aetherytes
-            .Where(a => !string.IsNullOrWhiteSpace(a.MapArea))
-            .Select(a => a.MapArea)
-            .Distinct(StringComparer.OrdinalIgnoreCase)
+        // The map area index keys are already unique, so no separate Distinct pass is needed
+        return aetherytesByMapArea.Keys
+            .Where(mapArea => !string.IsNullOrWhiteSpace(mapArea))
             .ToHashSet(StringComparer.OrdinalIgnoreCase);
     }
 
@@ -121,24 +132,7 @@ public class AetheryteService : IDisposable
         if (string.IsNullOrWhiteSpace(mapArea))
             return false;
 
-        return aetherytes.Any(a => a.MapArea.Equals(mapArea, StringComparison.OrdinalIgnoreCase));
-    }
-
-    /// <summary>
-    /// Gets the cheapest aetheryte to teleport to in a specific map area.
-    /// </summary>
-    /// <param name="mapArea">The map area name.</param>
-    /// <returns>The cheapest aetheryte, or null if none found.</returns>
-    public AetheryteInfo? GetCheapestAetheryteInMapArea(string mapArea)
-    {
-        var aetherytesInMap = GetAetherytesInMapArea(mapArea);
-        if (aetherytesInMap.Count == 0)
-            return null;
-
-        // Update teleport fees before sorting
-        UpdateTeleportFees(aetherytesInMap);
-
-        return aetherytesInMap.OrderBy(a => a.CalculateTeleportFee()).FirstOrDefault();
+        return aetherytesByMapArea.ContainsKey(mapArea);
     }
 
     /// <summary>
@@ -178,6 +172,15 @@ public class AetheryteService : IDisposable
             // Update the aetheryte list to ensure we have current data
             telepo->UpdateAetheryteList();
 
+            // Index the teleport list once so each aetheryte is a single lookup instead of a full scan
+            var teleportCosts = new Dictionary<uint, uint>();
+            int count = telepo->TeleportList.Count;
+            for (int i = 0; i < count; i++)
+            {
+                var info = telepo->TeleportList[i];
+                teleportCosts.TryAdd(info.AetheryteId, info.GilCost);
+            }
+
             foreach (var aetheryte in targetAetherytes)
             {
                 try
@@ -186,25 +189,14 @@ public class AetheryteService : IDisposable
                     // We'll rely on the Telepo API to provide accurate costs for all cases
 
                     // Get the real teleport cost from Telepo API
-                    bool foundCost = false;
-                    
-                    // Search for the aetheryte in the teleport list
-                    int count = telepo->TeleportList.Count;
-                    for (int i = 0; i < count; i++)
+                    if (teleportCosts.TryGetValue(aetheryte.AetheryteId, out var gilCost))
                     {
-                        var info = telepo->TeleportList[i];
-                        if (info.AetheryteId == aetheryte.AetheryteId)
-                        {
-                            aetheryte.ActualTeleportFee = (int)info.GilCost;
-                            foundCost = true;
-                            Plugin.Log.Debug($"Found teleport fee for {aetheryte.Name} from Telepo API: {aetheryte.ActualTeleportFee} gil");
-                            break;
-                        }
+                        aetheryte.ActualTeleportFee = (int)gilCost;
+                        Plugin.Log.Debug($"Found teleport fee for {aetheryte.Name} from Telepo API: {aetheryte.ActualTeleportFee} gil");
                     }
-
-                    // If we couldn't find the cost, leave ActualTeleportFee as 0
-                    if (!foundCost)
+                    else
                     {
+                        // If we couldn't find the cost, leave ActualTeleportFee as 0
                         Plugin.Log.Debug($"Could not find teleport fee for {aetheryte.Name} in Telepo API");
                     }
                 }
@@ -245,26 +237,20 @@ public class AetheryteService : IDisposable
                 return;
             }
 
-            // Read the JSON file
-            string jsonContent = File.ReadAllText(aetheryteJsonPath);
-            Plugin.Log.Debug($"Read JSON content with length: {jsonContent.Length}");
+            // Open the JSON file; the serializer reads UTF-8 directly from the stream,
+            // so the whole file never has to be materialized as a string first
+            using var jsonStream = File.OpenRead(aetheryteJsonPath);
+            Plugin.Log.Debug($"Opened JSON file with length: {jsonStream.Length}");
 
-            // If the JSON content is empty, log an error and return
-            if (string.IsNullOrWhiteSpace(jsonContent))
+            // If the JSON file is empty, log an error and return
+            if (jsonStream.Length == 0)
             {
                 Plugin.Log.Error("aetheryte.json file is empty");
                 return;
             }
 
             // Try to deserialize JSON
-            JsonSerializerOptions options = new JsonSerializerOptions
-            {
-                AllowTrailingCommas = true,
-                ReadCommentHandling = JsonCommentHandling.Skip,
-                PropertyNameCaseInsensitive = true
-            };
-
-            var aetheryteData = JsonSerializer.Deserialize<AetheryteData>(jsonContent, options);
+            var aetheryteData = JsonSerializer.Deserialize<AetheryteData>(jsonStream, JsonOptions);
 
             if (aetheryteData == null)
             {
@@ -292,6 +278,22 @@ public class AetheryteService : IDisposable
             }
 
             this.aetherytes = loadedAetherytes;
+
+            // Index aetherytes by map area once so per-area lookups don't scan the whole list
+            var loadedByMapArea = new Dictionary<string, List<AetheryteInfo>>(StringComparer.OrdinalIgnoreCase);
+            foreach (var aetheryteInfo in loadedAetherytes)
+            {
+                var mapArea = aetheryteInfo.MapArea ?? string.Empty;
+                if (!loadedByMapArea.TryGetValue(mapArea, out var mapAreaAetherytes))
+                {
+                    mapAreaAetherytes = new List<AetheryteInfo>();
+                    loadedByMapArea[mapArea] = mapAreaAetherytes;
+                }
+
+                mapAreaAetherytes.Add(aetheryteInfo);
+            }
+
+            this.aetherytesByMapArea = loadedByMapArea;
             Plugin.Log.Information($"Successfully loaded {this.aetherytes.Count} aetherytes from JSON file");
         }
         catch (Exception ex)
@@ -344,7 +346,8 @@ public class AetheryteService : IDisposable
     /// </summary>
     public void Dispose()
     {
-        // Clear aetheryte list to free memory
+        // Clear aetheryte list and index to free memory
         aetherytes.Clear();
+        aetherytesByMapArea.Clear();
     }
 }
@@ -1,6 +1,7 @@
 using System;
 using System.Text.RegularExpressions;
 using System.Collections.Generic;
+using System.Globalization;
 using System.Text;
 using System.Linq;
 using Dalamud.Game;
@@ -32,7 +33,28 @@ public class ChatMonitorService : IDisposable
     // [14:27][1]<Tataru T.> - with LinkShell channel
     // [16:30](Tataru Taru) - with Party channel
     // Named groups: time, channel (optional), player1 (angle brackets), player2 (parentheses)
-    private static readonly Regex PlayerNameRegex = new(@"\[(?<time>\d{1,2}:\d{2})\](?:\[(?<channel>[^\]]+)\])?(?:<(?<player1>[^>]+)>|\((?<player2>[^)]+)\))", RegexOptions.IgnoreCase);
+    private static readonly Regex PlayerNameRegex = new(@"\[(?<time>\d{1,2}:\d{2})\](?:\[(?<channel>[^\]]+)\])?(?:<(?<player1>[^>]+)>|\((?<player2>[^)]+)\))", RegexOptions.IgnoreCase | RegexOptions.Compiled);
+
+    // Split points for chat logs, using the same formats as PlayerNameRegex
+    private static readonly Regex ChatSegmentRegex = new(@"(?=\[\d{1,2}:\d{2}\](?:\[[^\]]+\])?(?:<[^>]+>|\([^)]+\)))", RegexOptions.Compiled);
+
+    // Legacy split points: any [hh:mm] timestamp
+    private static readonly Regex LegacyTimestampSegmentRegex = new(@"(?=\[\d+:\d+\])", RegexOptions.Compiled);
+
+    // English pattern: supports ASCII letters, numbers, spaces, apostrophes, hyphens
+    // Examples: "Heritage Found (15.0, 20.5)", "Ul'dah - Steps of Nald (8.2, 7.8)"
+    // Made optional map area with ? to handle coordinates without map names
+    private static readonly Regex EnglishCoordinateRegex = new(@"(?:([A-Za-z0-9\s''\-–—]+?)\s*)?\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*\)", RegexOptions.IgnoreCase | RegexOptions.Compiled);
+
+    // Japanese pattern: supports all Unicode letters and common punctuation used in Japanese
+    // This includes Hiragana, Katakana, Kanji, ASCII letters, numbers, spaces, and Japanese punctuation
+    // Examples: "ヘリテージファウンド (16.0, 21.3)", "リムサ・ロミンサ：下甲板層 (9.5, 11.2)"
+    private static readonly Regex JapaneseCoordinateRegex = new(@"(?:([\p{L}\p{N}\s''\-–—：・]+?)\s*)?\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*\)", RegexOptions.IgnoreCase | RegexOptions.Compiled);
+
+    // German and French pattern: supports all Unicode letters, numbers, spaces, and common punctuation
+    // This includes German umlauts and French accented characters
+    // Examples: "Östliche Noscea (21.0, 21.0)", "Noscea orientale (21.0, 21.0)", "Mor Dhona (22.2, 7.9)"
+    private static readonly Regex EuropeanCoordinateRegex = new(@"(?:([\p{L}\p{N}\s''\-–—]+?)\s*)?\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*\)", RegexOptions.IgnoreCase | RegexOptions.Compiled);
 
     /// <summary>
     /// Event raised when a coordinate is detected in chat.
@@ -208,12 +230,23 @@ public class ChatMonitorService : IDisposable
             if (chatMessage.LogKind != GetConfiguredChatType())
                 return;
 
-            // Extract player information from sender
-            string playerName = ExtractPlayerName(chatMessage.Sender);
+            // Check if we should import coordinates before doing any sender or message processing
+            if (!isImportingCoordinates)
+            {
+                Plugin.Log.Debug("Coordinate import is paused. Ignoring coordinates from chat.");
+                return;
+            }
 
             // Extract the message text
             string messageText = chatMessage.Message.TextValue;
 
+            // Every coordinate pattern requires "(x, y)", so skip messages that cannot contain one
+            if (!messageText.Contains('('))
+                return;
+
+            // Extract player information from sender
+            string playerName = ExtractPlayerName(chatMessage.Sender);
+
             // Look for coordinates in the message
             ExtractCoordinates(messageText, playerName);
         }
@@ -277,60 +310,12 @@ public class ChatMonitorService : IDisposable
 /// <param name="playerName">The player name.</param>
 private void ExtractCoordinates(string messageText, string playerName)
 {
-    // Check if we should import coordinates
-    if (!isImportingCoordinates)
-    {
-        Plugin.Log.Debug("Coordinate import is paused. Ignoring coordinates from chat.");
-        return;
-    }
-    
     // Clean message text from special characters that might interfere with coordinate extraction
     // This is important for party chat where messages may contain BoxedNumber characters
     string cleanedText = RemoveSpecialCharactersFromMessage(messageText);
 
-    // Get language-specific coordinate regex
-    var coordinateRegex = GetCoordinateRegexForCurrentLanguage();
-
     Plugin.Log.Debug($"Chat monitoring: Processing message from {playerName}");
-    var matches = coordinateRegex.Matches(cleanedText);
-    Plugin.Log.Debug($"Found {matches.Count} coordinate matches");
-    foreach (Match match in matches)
-    {
-        if (match.Groups.Count >= 4 &&
-            float.TryParse(match.Groups[2].Value, out var x) &&
-            float.TryParse(match.Groups[3].Value, out var y))
-        {
-            // Extract map area (if present)
-            string mapArea = match.Groups[1].Success ? match.Groups[1].Value.Trim() : string.Empty;
-
-            // Validate map area using English translation if needed, but keep original for display
-            if (!string.IsNullOrEmpty(mapArea))
-            {
-                var (isValid, englishMapArea, originalMapArea) = MapAreaHelper.TranslateAndValidateMapArea(
-                    mapArea,
-                    plugin.MapAreaTranslationService,
-                    plugin.AetheryteService,
-                    "- chat monitoring");
-
-                if (!isValid)
-                {
-                    Plugin.Log.Warning($"Chat monitoring: Skipping coordinate due to invalid map area");
-                    return; // Skip this coordinate
-                }
-            }
-
-            // Use the cleaned player name to create the coordinate with original map area name
-            var coordinate = new TreasureCoordinate(x, y, mapArea, CoordinateSystemType.Map, playerName);
-
-            Plugin.Log.Information($"Coordinate detected from {playerName}: {mapArea} ({x}, {y})");
-
-            // Directly add the coordinate to preserve player name instead of re-importing
-            plugin.TreasureHuntService.AddCoordinate(coordinate);
-
-            // Raise the event
-            OnCoordinateDetected?.Invoke(this, coordinate);
-        }
-    }
+    AddCoordinatesFromText(cleanedText, GetCoordinateRegexForCurrentLanguage(), playerName, "chat monitoring");
 }
 
 /// <summary>
@@ -347,7 +332,10 @@ public bool ProcessChatMessage(string playerName, string message)
         
         // Break the message into segments, since it might contain multiple coordinates
         string[] segments = SplitMessageIntoSegments(message);
-        
+
+        // Look for coordinates in each segment using language-specific regex
+        var coordinateRegex = GetCoordinateRegexForCurrentLanguage();
+
         foreach (string segment in segments)
         {
             // Try to extract player name from the segment
@@ -355,55 +343,10 @@ public bool ProcessChatMessage(string playerName, string message)
             
             // Use extracted player name if available, otherwise use the provided one
             string effectivePlayerName = !string.IsNullOrEmpty(extractedPlayerName) ? extractedPlayerName : playerName;
-            
-            // Look for coordinates in the segment using language-specific regex
-            var coordinateRegex = GetCoordinateRegexForCurrentLanguage();
-            var matches = coordinateRegex.Matches(segment);
-            Plugin.Log.Debug($"Manual chat processing: Found {matches.Count} matches in segment");
-            foreach (Match match in matches)
-            {
-                if (match.Groups.Count >= 4 &&
-                    float.TryParse(match.Groups[2].Value, out var x) &&
-                    float.TryParse(match.Groups[3].Value, out var y))
-                {
-                    // Extract map area (if present)
-                    string mapArea = match.Groups[1].Success ? match.Groups[1].Value.Trim() : string.Empty;
-
-                    // Remove player name from map area if it was incorrectly captured
-                    if (!string.IsNullOrEmpty(effectivePlayerName) && !string.IsNullOrEmpty(mapArea))
-                    {
-                        mapArea = RemovePlayerNameFromMapArea(mapArea, effectivePlayerName);
-                    }
-
-                    // Validate map area using English translation if needed, but keep original for display
-                    if (!string.IsNullOrEmpty(mapArea))
-                    {
-                        var (isValid, englishMapArea, originalMapArea) = MapAreaHelper.TranslateAndValidateMapArea(
-                            mapArea,
-                            plugin.MapAreaTranslationService,
-                            plugin.AetheryteService,
-                            "- manual chat processing");
-
-                        if (!isValid)
-                        {
-                            Plugin.Log.Warning($"Manual chat processing: Skipping coordinate due to invalid map area");
-                            continue; // Skip this coordinate
-                        }
-                    }
-
-                    // Create coordinate with original map area name for display
-                    var coordinate = new TreasureCoordinate(x, y, mapArea, CoordinateSystemType.Map, effectivePlayerName);
-
-                    Plugin.Log.Information($"Coordinate detected from {effectivePlayerName}: {mapArea} ({x}, {y})");
 
-                    // Directly add the coordinate to preserve player name instead of re-importing
-                    plugin.TreasureHuntService.AddCoordinate(coordinate);
-
-                    // Raise the event
-                    OnCoordinateDetected?.Invoke(this, coordinate);
-                    
-                    foundAnyCoordinates = true;
-                }
+            if (AddCoordinatesFromText(segment, coordinateRegex, effectivePlayerName, "manual chat processing") > 0)
+            {
+                foundAnyCoordinates = true;
             }
         }
         
@@ -416,6 +359,70 @@ public bool ProcessChatMessage(string playerName, string message)
     }
 }
 
+/// <summary>
+/// Adds every valid coordinate found in a text to the treasure hunt.
+/// Shared by live chat monitoring and manual chat processing.
+/// </summary>
+/// <param name="text">The text to search for coordinates.</param>
+/// <param name="coordinateRegex">The language-specific coordinate regex.</param>
+/// <param name="playerName">The player name to attach to each coordinate.</param>
+/// <param name="logContext">Short description of the caller used in log messages.</param>
+/// <returns>The number of coordinates added.</returns>
+private int AddCoordinatesFromText(string text, Regex coordinateRegex, string playerName, string logContext)
+{
+    int addedCount = 0;
+
+    var matches = coordinateRegex.Matches(text);
+    Plugin.Log.Debug($"Found {matches.Count} coordinate matches ({logContext})");
+    foreach (Match match in matches)
+    {
+        // Parse the captured numbers in place; the patterns only accept '.' decimals, so use the invariant culture
+        if (float.TryParse(match.Groups[2].ValueSpan, NumberStyles.Float, CultureInfo.InvariantCulture, out var x) &&
+            float.TryParse(match.Groups[3].ValueSpan, NumberStyles.Float, CultureInfo.InvariantCulture, out var y))
+        {
+            // Extract map area (if present)
+            string mapArea = match.Groups[1].Success ? match.Groups[1].Value.Trim() : string.Empty;
+
+            // Remove player name from map area if it was incorrectly captured
+            if (!string.IsNullOrEmpty(playerName) && !string.IsNullOrEmpty(mapArea))
+            {
+                mapArea = RemovePlayerNameFromMapArea(mapArea, playerName);
+            }
+
+            // Validate map area using English translation if needed, but keep original for display
+            if (!string.IsNullOrEmpty(mapArea))
+            {
+                var (isValid, englishMapArea, originalMapArea) = MapAreaHelper.TranslateAndValidateMapArea(
+                    mapArea,
+                    plugin.MapAreaTranslationService,
+                    plugin.AetheryteService,
+                    $"- {logContext}");
+
+                if (!isValid)
+                {
+                    Plugin.Log.Warning($"Skipping coordinate due to invalid map area ({logContext})");
+                    continue; // Skip this coordinate
+                }
+            }
+
+            // Create coordinate with original map area name for display
+            var coordinate = new TreasureCoordinate(x, y, mapArea, CoordinateSystemType.Map, playerName);
+
+            Plugin.Log.Information($"Coordinate detected from {playerName}: {mapArea} ({x}, {y})");
+
+            // Directly add the coordinate to preserve player name instead of re-importing
+            plugin.TreasureHuntService.AddCoordinate(coordinate);
+
+            // Raise the event
+            OnCoordinateDetected?.Invoke(this, coordinate);
+
+            addedCount++;
+        }
+    }
+
+    return addedCount;
+}
+
 /// <summary>
 /// Splits a message into segments that might contain individual coordinates.
 /// </summary>
@@ -427,12 +434,12 @@ private string[] SplitMessageIntoSegments(string message)
     // [14:27][CWLS1]<Tataru T.> - with CrossWorldLinkShell channel
     // [14:27][1]<Tataru T.> - with LinkShell channel
     // [16:30](Tataru Taru) - with Party channel
-    var chatSegments = Regex.Split(message, @"(?=\[\d{1,2}:\d{2}\](?:\[[^\]]+\])?(?:<[^>]+>|\([^)]+\)))");
+    var chatSegments = ChatSegmentRegex.Split(message);
 
     // If no new format found, try legacy timestamp splitting
     if (chatSegments.Length <= 1)
     {
-        chatSegments = Regex.Split(message, @"(?=\[\d+:\d+\])");
+        chatSegments = LegacyTimestampSegmentRegex.Split(message);
     }
 
     // If still no segments found, return the whole message
@@ -1026,67 +1033,19 @@ private string RemovePlayerNameFromMapArea(string mapArea, string playerName)
     private Regex GetCoordinateRegexForCurrentLanguage()
     {
         var currentLanguage = Svc.ClientState.ClientLanguage;
-        Plugin.Log.Information($"Creating coordinate regex for chat monitoring, language: {currentLanguage}");
 
         var regex = currentLanguage switch
         {
-            ClientLanguage.Japanese => GetJapaneseCoordinateRegex(),
-            ClientLanguage.German => GetGermanCoordinateRegex(),
-            ClientLanguage.French => GetFrenchCoordinateRegex(),
-            _ => GetEnglishCoordinateRegex() // Default to English for English and any other languages
+            ClientLanguage.Japanese => JapaneseCoordinateRegex,
+            ClientLanguage.German => EuropeanCoordinateRegex,
+            ClientLanguage.French => EuropeanCoordinateRegex,
+            _ => EnglishCoordinateRegex // Default to English for English and any other languages
         };
 
-        Plugin.Log.Information($"Selected chat monitoring regex pattern: {regex}");
+        Plugin.Log.Debug($"Using chat monitoring regex for language {currentLanguage}: {regex}");
         return regex;
     }
 
-    /// <summary>
-    /// Gets regex pattern optimized for English map area names.
-    /// </summary>
-    private Regex GetEnglishCoordinateRegex()
-    {
-        // English pattern: supports ASCII letters, numbers, spaces, apostrophes, hyphens
-        // Examples: "Heritage Found (15.0, 20.5)", "Ul'dah - Steps of Nald (8.2, 7.8)"
-        // Made optional map area with ? to handle coordinates without map names
-        return new Regex(@"(?:([A-Za-z0-9\s''\-–—]+?)\s*)?\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*\)", RegexOptions.IgnoreCase);
-    }
-
-    /// <summary>
-    /// Gets regex pattern optimized for Japanese map area names.
-    /// </summary>
-    private Regex GetJapaneseCoordinateRegex()
-    {
-        // Japanese pattern: supports all Unicode letters and common punctuation used in Japanese
-        // This includes Hiragana, Katakana, Kanji, ASCII letters, numbers, spaces, and Japanese punctuation
-        // Examples: "ヘリテージファウンド (16.0, 21.3)", "リムサ・ロミンサ：下甲板層 (9.5, 11.2)"
-        // Made optional map area with ? to handle coordinates without map names
-        return new Regex(@"(?:([\p{L}\p{N}\s''\-–—：・]+?)\s*)?\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*\)", RegexOptions.IgnoreCase);
-    }
-
-    /// <summary>
-    /// Gets regex pattern optimized for German map area names.
-    /// </summary>
-    private Regex GetGermanCoordinateRegex()
-    {
-        // German pattern: supports all Unicode letters, numbers, spaces, and common punctuation
-        // This includes German umlauts and other special characters
-        // Examples: "Östliche Noscea (21.0, 21.0)", "Mor Dhona (22.2, 7.9)"
-        // Made optional map area with ? to handle coordinates without map names
-        return new Regex(@"(?:([\p{L}\p{N}\s''\-–—]+?)\s*)?\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*\)", RegexOptions.IgnoreCase);
-    }
-
-    /// <summary>
-    /// Gets regex pattern optimized for French map area names.
-    /// </summary>
-    private Regex GetFrenchCoordinateRegex()
-    {
-        // French pattern: supports all Unicode letters, numbers, spaces, and common punctuation
-        // This includes French accented characters
-        // Examples: "Noscea orientale (21.0, 21.0)", "Mor Dhona (22.2, 7.9)"
-        // Made optional map area with ? to handle coordinates without map names
-        return new Regex(@"(?:([\p{L}\p{N}\s''\-–—]+?)\s*)?\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*\)", RegexOptions.IgnoreCase);
-    }
-
     /// <summary>
     /// Disposes the service.
     /// </summary>
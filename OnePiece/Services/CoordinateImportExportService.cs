@@ -1,5 +1,6 @@
 using System;
 using System.Collections.Generic;
+using System.Globalization;
 using System.Linq;
 using System.Text;
 using System.Text.Json;
@@ -23,6 +24,40 @@ public class CoordinateImportExportService
     private readonly MapAreaTranslationService mapAreaTranslationService;
     private readonly PlayerNameProcessingService playerNameProcessingService;
 
+    // JSON serializer options for exports: ignore null and default values, compact format for smaller size.
+    // Shared so the serializer's type metadata cache is reused across exports.
+    private static readonly JsonSerializerOptions ExportJsonOptions = new()
+    {
+        DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingDefault,
+        WriteIndented = false
+    };
+
+    // Regular expression to match player names in various chat formats:
+    // [14:27][CWLS1]<Tataru T.> - with CrossWorldLinkShell channel
+    // [14:27][1]<Tataru T.> - with LinkShell channel
+    // [16:30](Tataru Taru) - with Party channel
+    private static readonly Regex PlayerNameRegex = new(@"\[(?<time>\d{1,2}:\d{2})\](?:\[(?<channel>[^\]]+)\])?(?:<(?<player1>[^>]+)>|\((?<player2>[^)]+)\))", RegexOptions.IgnoreCase | RegexOptions.Compiled);
+
+    // Split points for pasted chat logs, using the same formats as PlayerNameRegex
+    private static readonly Regex ChatSegmentRegex = new(@"(?=\[\d{1,2}:\d{2}\](?:\[[^\]]+\])?(?:<[^>]+>|\([^)]+\)))", RegexOptions.Compiled);
+
+    // Legacy split points: any [hh:mm] timestamp
+    private static readonly Regex LegacyTimestampSegmentRegex = new(@"(?=\[\d+:\d+\])", RegexOptions.Compiled);
+
+    // English pattern: supports ASCII letters, numbers, spaces, apostrophes, hyphens
+    // Examples: "Heritage Found (15.0, 20.5)", "Ul'dah - Steps of Nald (8.2, 7.8)"
+    private static readonly Regex EnglishCoordinateRegex = new(@"([A-Za-z0-9\s''\-–—]+?)\s*\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*\)", RegexOptions.IgnoreCase | RegexOptions.Compiled);
+
+    // Japanese pattern: supports all Unicode letters and common punctuation used in Japanese
+    // This includes Hiragana, Katakana, Kanji, ASCII letters, numbers, spaces, and Japanese punctuation
+    // Examples: "ヘリテージファウンド (16.0, 21.3)", "リムサ・ロミンサ：下甲板層 (9.5, 11.2)"
+    private static readonly Regex JapaneseCoordinateRegex = new(@"([\p{L}\p{N}\s''\-–—：・]+?)\s*\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*\)", RegexOptions.IgnoreCase | RegexOptions.Compiled);
+
+    // German and French pattern: supports all Unicode letters, numbers, spaces, and common punctuation
+    // This includes German umlauts and French accented characters
+    // Examples: "Östliche Noscea (21.0, 21.0)", "Noscea orientale (21.0, 21.0)", "Mor Dhona (22.2, 7.9)"
+    private static readonly Regex EuropeanCoordinateRegex = new(@"([\p{L}\p{N}\s''\-–—]+?)\s*\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*\)", RegexOptions.IgnoreCase | RegexOptions.Compiled);
+
     /// <summary>
     /// Initializes a new instance of the <see cref="CoordinateImportExportService"/> class.
     /// </summary>
@@ -163,12 +198,6 @@ public class CoordinateImportExportService
     /// <returns>The number of coordinates imported.</returns>
     private int ImportCoordinatesFromText(string text, Action<TreasureCoordinate> addCoordinateAction)
     {
-        // Regular expression to match player names in various chat formats:
-        // [14:27][CWLS1]<Tataru T.> - with CrossWorldLinkShell channel
-        // [14:27][1]<Tataru T.> - with LinkShell channel
-        // [16:30](Tataru Taru) - with Party channel
-        var playerNameRegex = new Regex(@"\[(?<time>\d{1,2}:\d{2})\](?:\[(?<channel>[^\]]+)\])?(?:<(?<player1>[^>]+)>|\((?<player2>[^)]+)\))", RegexOptions.IgnoreCase);
-        
         // Get language-specific coordinate regex based on current game client language
         var coordinateRegex = GetCoordinateRegexForCurrentLanguage();
 
@@ -188,7 +217,7 @@ public class CoordinateImportExportService
             Plugin.Log.Debug($"Processing segment {i + 1}/{segments.Length}");
 
             // Try to extract player name from segment
-            string playerName = ExtractPlayerNameFromSegment(segment, playerNameRegex);
+            string playerName = ExtractPlayerNameFromSegment(segment);
             if (!string.IsNullOrEmpty(playerName))
             {
                 Plugin.Log.Debug($"Extracted player name: '{playerName}'");
@@ -210,9 +239,9 @@ public class CoordinateImportExportService
                 Plugin.Log.Debug($"Match {matchCount}: {match.Groups[1].Value} ({match.Groups[2].Value}, {match.Groups[3].Value})");
 
                 // Process all matches that have valid coordinates and map area
-                if (match.Groups.Count >= 4 &&
-                    float.TryParse(match.Groups[2].Value, out var x) &&
-                    float.TryParse(match.Groups[3].Value, out var y))
+                // Parse the captured numbers in place; the patterns only accept '.' decimals, so use the invariant culture
+                if (float.TryParse(match.Groups[2].ValueSpan, NumberStyles.Float, CultureInfo.InvariantCulture, out var x) &&
+                    float.TryParse(match.Groups[3].ValueSpan, NumberStyles.Float, CultureInfo.InvariantCulture, out var y))
                 {
                     // Extract map area (guaranteed to be present due to regex requirement)
                     string mapArea = match.Groups[1].Value.Trim();
@@ -291,21 +320,14 @@ public class CoordinateImportExportService
             // Convert to optimized export format to reduce data size
             var optimizedCoordinates = coordinates.Select(coord => CreateOptimizedExportData(coord)).ToList();
 
-            // Configure JSON serializer to ignore null values and default values
-            var options = new JsonSerializerOptions
-            {
-                DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingDefault,
-                WriteIndented = false // Compact format for smaller size
-            };
-
             // Serialize the optimized coordinates to JSON
-            var json = System.Text.Json.JsonSerializer.Serialize(optimizedCoordinates, options);
+            var json = System.Text.Json.JsonSerializer.Serialize(optimizedCoordinates, ExportJsonOptions);
 
             // Encode the JSON as Base64
             var bytes = System.Text.Encoding.UTF8.GetBytes(json);
             var base64 = Convert.ToBase64String(bytes);
 
-            Plugin.Log.Debug($"Exported {coordinates.Count} coordinates. Original size estimate: {EstimateFullSize(coordinates)} chars, Optimized size: {json.Length} chars");
+            Plugin.Log.Debug($"Exported {coordinates.Count} coordinates. Optimized size: {json.Length} chars");
 
             return base64;
         }
@@ -370,24 +392,6 @@ public class CoordinateImportExportService
         return exportData;
     }
 
-    /// <summary>
-    /// Estimates the size of the full coordinate data for comparison.
-    /// </summary>
-    /// <param name="coordinates">The coordinates to estimate size for.</param>
-    /// <returns>Estimated character count of full serialization.</returns>
-    private int EstimateFullSize(List<TreasureCoordinate> coordinates)
-    {
-        try
-        {
-            var fullJson = System.Text.Json.JsonSerializer.Serialize(coordinates);
-            return fullJson.Length;
-        }
-        catch
-        {
-            return 0; // Return 0 if estimation fails
-        }
-    }
-
     /// <summary>
     /// Creates a TreasureCoordinate from optimized export data.
     /// </summary>
@@ -456,64 +460,19 @@ public class CoordinateImportExportService
     private Regex GetCoordinateRegexForCurrentLanguage()
     {
         var currentLanguage = Svc.ClientState.ClientLanguage;
-        Plugin.Log.Information($"Creating coordinate regex for language: {currentLanguage}");
 
         var regex = currentLanguage switch
         {
-            ClientLanguage.Japanese => GetJapaneseCoordinateRegex(),
-            ClientLanguage.German => GetGermanCoordinateRegex(),
-            ClientLanguage.French => GetFrenchCoordinateRegex(),
-            _ => GetEnglishCoordinateRegex() // Default to English for English and any other languages
+            ClientLanguage.Japanese => JapaneseCoordinateRegex,
+            ClientLanguage.German => EuropeanCoordinateRegex,
+            ClientLanguage.French => EuropeanCoordinateRegex,
+            _ => EnglishCoordinateRegex // Default to English for English and any other languages
         };
 
-        Plugin.Log.Information($"Selected regex pattern: {regex}");
+        Plugin.Log.Debug($"Using coordinate regex for language {currentLanguage}: {regex}");
         return regex;
     }
 
-    /// <summary>
-    /// Gets regex pattern optimized for English map area names.
-    /// </summary>
-    private Regex GetEnglishCoordinateRegex()
-    {
-        // English pattern: supports ASCII letters, numbers, spaces, apostrophes, hyphens
-        // Examples: "Heritage Found (15.0, 20.5)", "Ul'dah - Steps of Nald (8.2, 7.8)"
-        return new Regex(@"([A-Za-z0-9\s''\-–—]+?)\s*\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*\)", RegexOptions.IgnoreCase);
-    }
-
-    /// <summary>
-    /// Gets regex pattern optimized for Japanese map area names.
-    /// </summary>
-    private Regex GetJapaneseCoordinateRegex()
-    {
-        // Japanese pattern: supports all Unicode letters and common punctuation used in Japanese
-        // This includes Hiragana, Katakana, Kanji, ASCII letters, numbers, spaces, and Japanese punctuation
-        // Examples: "ヘリテージファウンド (16.0, 21.3)", "リムサ・ロミンサ：下甲板層 (9.5, 11.2)"
-        // Using \s+ to handle multiple spaces and \s* for flexible spacing around parentheses
-        return new Regex(@"([\p{L}\p{N}\s''\-–—：・]+?)\s*\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*\)", RegexOptions.IgnoreCase);
-    }
-
-    /// <summary>
-    /// Gets regex pattern optimized for German map area names.
-    /// </summary>
-    private Regex GetGermanCoordinateRegex()
-    {
-        // German pattern: supports all Unicode letters, numbers, spaces, and common punctuation
-        // This includes German umlauts and other special characters
-        // Examples: "Östliche Noscea (21.0, 21.0)", "Mor Dhona (22.2, 7.9)"
-        return new Regex(@"([\p{L}\p{N}\s''\-–—]+?)\s*\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*\)", RegexOptions.IgnoreCase);
-    }
-
-    /// <summary>
-    /// Gets regex pattern optimized for French map area names.
-    /// </summary>
-    private Regex GetFrenchCoordinateRegex()
-    {
-        // French pattern: supports all Unicode letters, numbers, spaces, and common punctuation
-        // This includes French accented characters
-        // Examples: "Noscea orientale (21.0, 21.0)", "Mor Dhona (22.2, 7.9)"
-        return new Regex(@"([\p{L}\p{N}\s''\-–—]+?)\s*\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*\)", RegexOptions.IgnoreCase);
-    }
-
     /// <summary>
     /// Logs the first few valid map areas to help users understand the required format.
     /// </summary>
@@ -551,12 +510,12 @@ public class CoordinateImportExportService
         // [14:27][CWLS1]<Tataru T.> - with CrossWorldLinkShell channel
         // [14:27][1]<Tataru T.> - with LinkShell channel
         // [16:30](Tataru Taru) - with Party channel
-        var chatSegments = Regex.Split(text, @"(?=\[\d{1,2}:\d{2}\](?:\[[^\]]+\])?(?:<[^>]+>|\([^)]+\)))");
+        var chatSegments = ChatSegmentRegex.Split(text);
 
         // If no new format found, try legacy timestamp splitting
         if (chatSegments.Length <= 1)
         {
-            chatSegments = Regex.Split(text, @"(?=\[\d+:\d+\])");
+            chatSegments = LegacyTimestampSegmentRegex.Split(text);
         }
 
         // If still no segments found, return the whole text
@@ -573,11 +532,10 @@ public class CoordinateImportExportService
     /// Extracts player name from a text segment.
     /// </summary>
     /// <param name="segment">The text segment.</param>
-    /// <param name="playerNameRegex">The regex to use for player name extraction.</param>
     /// <returns>The extracted player name, or empty string if none found.</returns>
-    private string ExtractPlayerNameFromSegment(string segment, Regex playerNameRegex)
+    private string ExtractPlayerNameFromSegment(string segment)
     {
-        var match = playerNameRegex.Match(segment);
+        var match = PlayerNameRegex.Match(segment);
         if (match.Success)
         {
             // Extract player name from either capture group (angle brackets or parentheses)
@@ -16,6 +16,7 @@ namespace OnePiece.Services
         private readonly Dictionary<string, string> translationCache;
         private readonly Dictionary<string, string> currentLanguageMapping;
         private readonly ClientLanguage currentClientLanguage;
+        private HashSet<string>? englishPlaceNames;
         private bool isInitialized = false;
 
         public MapAreaTranslationService()
@@ -107,12 +108,9 @@ namespace OnePiece.Services
         {
             try
             {
-                var englishPlaceNames = Svc.Data.GetExcelSheet<PlaceName>(ClientLanguage.English);
-                if (englishPlaceNames == null)
-                    return false;
-
-                return englishPlaceNames.Any(place => 
-                    place.Name.ToString().Equals(mapAreaName, StringComparison.OrdinalIgnoreCase));
+                // Build the name set on first use instead of converting every PlaceName row on each lookup
+                englishPlaceNames ??= LoadEnglishPlaceNames();
+                return englishPlaceNames.Contains(mapAreaName);
             }
             catch (Exception ex)
             {
@@ -121,6 +119,29 @@ namespace OnePiece.Services
             }
         }
 
+        /// <summary>
+        /// Loads all non-empty English PlaceName names into a case-insensitive set.
+        /// </summary>
+        /// <returns>The set of English place names, or an empty set if the sheet is unavailable.</returns>
+        private static HashSet<string> LoadEnglishPlaceNames()
+        {
+            var names = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
+
+            var placeNameSheet = Svc.Data.GetExcelSheet<PlaceName>(ClientLanguage.English);
+            if (placeNameSheet == null)
+                return names;
+
+            foreach (var place in placeNameSheet)
+            {
+                var name = place.Name.ToString();
+                if (!string.IsNullOrWhiteSpace(name))
+                    names.Add(name);
+            }
+
+            Plugin.Log.Debug($"Cached {names.Count} English place names");
+            return names;
+        }
+
         /// <summary>
         /// Builds mapping from current client language to English using PlaceName Excel data.
         /// Only loads data for the current client language for optimal performance.
@@ -52,16 +52,18 @@ public class PlayerNameProcessingService
 
         try
         {
-            var jobAbbreviations = GetJobAbbreviations();
+            // Look up name spans directly so no substring is allocated per candidate
+            var jobAbbreviations = GetJobAbbreviations().GetAlternateLookup<ReadOnlySpan<char>>();
             var trimmedName = name.Trim();
 
-            // Check if the name starts with any job abbreviation followed by a space
-            foreach (var jobAbbr in jobAbbreviations)
+            // Check if the first word is a job abbreviation with a single set lookup
+            var spaceIndex = trimmedName.IndexOf(' ');
+            if (spaceIndex > 0)
             {
-                if (trimmedName.StartsWith(jobAbbr + " ", StringComparison.OrdinalIgnoreCase))
+                if (jobAbbreviations.TryGetValue(trimmedName.AsSpan(0, spaceIndex), out var jobAbbr))
                 {
                     // Remove the job abbreviation and the following space
-                    var cleanedName = trimmedName.Substring(jobAbbr.Length + 1).Trim();
+                    var cleanedName = trimmedName.Substring(spaceIndex + 1).Trim();
                     Plugin.Log.Debug($"Removed job abbreviation '{jobAbbr}' from player name: '{trimmedName}' -> '{cleanedName}'");
                     return cleanedName;
                 }
@@ -88,7 +90,8 @@ public class PlayerNameProcessingService
 
         try
         {
-            var serverNames = GetServerNames();
+            // Look up name spans directly so no substring is allocated per suffix
+            var serverNames = GetServerNames().GetAlternateLookup<ReadOnlySpan<char>>();
             var trimmedName = name.Trim();
 
             // Split the name into parts by spaces
@@ -100,41 +103,35 @@ public class PlayerNameProcessingService
                 var firstPart = nameParts[0];
                 var secondPart = nameParts[1];
 
-                // Check if the second part ends with a server name
-                foreach (var serverName in serverNames)
+                if (serverNames.Contains(secondPart.AsSpan()))
                 {
-                    if (secondPart.EndsWith(serverName, StringComparison.OrdinalIgnoreCase))
+                    // The entire second part is just the server name, this is a separate word case
+                    // Don't remove it as it's likely part of the player name
+                    Plugin.Log.Debug($"Second part '{secondPart}' is entirely server name, keeping as player name: '{trimmedName}'");
+                }
+
+                // Check if the second part ends with a server name by looking up its suffixes, longest first,
+                // instead of testing every known server name
+                for (var serverStartIndex = 1; serverStartIndex < secondPart.Length; serverStartIndex++)
+                {
+                    if (!serverNames.TryGetValue(secondPart.AsSpan(serverStartIndex), out var serverName))
+                        continue;
+
+                    // Key logic: Check if the entire second part uses camelCase pattern
+                    // This means it starts with a capital letter and has mixed case
+                    if (IsCamelCaseWord(secondPart))
                     {
-                        // Check if there's content before the server name
-                        var serverStartIndex = secondPart.Length - serverName.Length;
-                        if (serverStartIndex > 0)
-                        {
-                            var beforeServerPart = secondPart.Substring(0, serverStartIndex);
-
-                            // Key logic: Check if the entire second part uses camelCase pattern
-                            // This means it starts with a capital letter and has mixed case
-                            if (IsCamelCaseWord(secondPart))
-                            {
-                                // Remove the server name from the second part
-                                var cleanedSecondPart = beforeServerPart;
-                                var cleanedName = $"{firstPart} {cleanedSecondPart}";
-
-                                Plugin.Log.Debug($"Removed server name '{serverName}' from camelCase player name: '{trimmedName}' -> '{cleanedName}'");
-                                return cleanedName;
-                            }
-                            else
-                            {
-                                // No camelCase pattern detected, keep the original name
-                                Plugin.Log.Debug($"No camelCase pattern detected in '{secondPart}', keeping original name: '{trimmedName}'");
-                            }
-                        }
-                        else
-                        {
-                            // The entire second part is just the server name, this is a separate word case
-                            // Don't remove it as it's likely part of the player name
-                            Plugin.Log.Debug($"Second part '{secondPart}' is entirely server name, keeping as player name: '{trimmedName}'");
-                        }
+                        // Remove the server name from the second part
+                        var cleanedSecondPart = secondPart.Substring(0, serverStartIndex);
+                        var cleanedName = $"{firstPart} {cleanedSecondPart}";
+
+                        Plugin.Log.Debug($"Removed server name '{serverName}' from camelCase player name: '{trimmedName}' -> '{cleanedName}'");
+                        return cleanedName;
                     }
+
+                    // No camelCase pattern detected, keep the original name
+                    Plugin.Log.Debug($"No camelCase pattern detected in '{secondPart}', keeping original name: '{trimmedName}'");
+                    break;
                 }
             }
 
@@ -572,8 +572,9 @@ public class RouteOptimizationService
         // Always attempt to get actual teleport costs, regardless of current location knowledge
         // The Telepo API can provide accurate costs even when player location is unknown
         
-        // Use AetheryteService to get teleport costs, which internally uses Telepo API
-        
+        // Collect the aetherytes of every map area that needs a teleport, then refresh their
+        // fees through the Telepo API in one pass instead of once (or twice) per map area
+        var aetherytesByMapArea = new Dictionary<string, IReadOnlyList<AetheryteInfo>>();
         foreach (var mapArea in targetMapAreas)
         {
             // If it's the current map area and we know where we are, no teleport needed
@@ -582,15 +583,22 @@ public class RouteOptimizationService
                 result[mapArea] = 0;
                 continue;
             }
-            
-            // Get the cheapest aetheryte in this map area
-            var cheapestAetheryte = plugin.AetheryteService.GetCheapestAetheryteInMapArea(mapArea);
+
+            aetherytesByMapArea.TryAdd(mapArea, plugin.AetheryteService.GetAetherytesInMapArea(mapArea));
+        }
+
+        if (aetherytesByMapArea.Count > 0)
+        {
+            plugin.AetheryteService.UpdateTeleportFees(aetherytesByMapArea.Values.SelectMany(a => a));
+        }
+
+        foreach (var (mapArea, aetherytesInMap) in aetherytesByMapArea)
+        {
+            // Get the cheapest aetheryte in this map area using the fees refreshed above
+            var cheapestAetheryte = aetherytesInMap.MinBy(a => a.CalculateTeleportFee());
             
             if (cheapestAetheryte != null)
             {
-                // Update teleport fees
-                plugin.AetheryteService.UpdateTeleportFees(new[] { cheapestAetheryte });
-                
                 // Get actual teleport cost from the aetheryte
                 uint teleportCost;
 
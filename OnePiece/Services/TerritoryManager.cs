@@ -41,12 +41,11 @@ public class TerritoryManager
             LoadTerritoryDetails();
         }
 
-        var territoryDetails = this.territoryDetails
-                                   .Where(x => x.Name.Equals(zone, StringComparison.OrdinalIgnoreCase) ||
-                                               (matchPartial && x.Name.Contains(zone, StringComparison.CurrentCultureIgnoreCase)))
-                                   .OrderBy(x => x.Name.Length);
-
-        var territoryDetail = territoryDetails.FirstOrDefault();
+        // Pick the shortest matching name in a single pass instead of sorting every candidate
+        var territoryDetail = this.territoryDetails
+                                  .Where(x => x.Name.Equals(zone, StringComparison.OrdinalIgnoreCase) ||
+                                              (matchPartial && x.Name.Contains(zone, StringComparison.CurrentCultureIgnoreCase)))
+                                  .MinBy(x => x.Name.Length);
 
         if (territoryDetail == null)
         {
@@ -103,11 +102,11 @@ public class TerritoryManager
             {
                 try
                 {
-                    var type = territoryType.Bg.ToString().Split('/');
-                    if (type.Length < 3) continue;
+                    var category = GetBgCategory(territoryType.Bg.ToString());
+                    if (category == null) continue;
 
                     // Only include town, field, and housing areas
-                    if (type[2] != "twn" && type[2] != "fld" && type[2] != "hou") continue;
+                    if (category != "twn" && category != "fld" && category != "hou") continue;
 
                     // Check if Map reference is valid
                     if (territoryType.Map.ValueNullable == null) continue;
@@ -118,14 +117,15 @@ public class TerritoryManager
                     var placeName = map.PlaceName.Value;
 
                     // Check if the place name is not empty
-                    if (string.IsNullOrWhiteSpace(placeName.Name.ToString())) continue;
+                    var name = placeName.Name.ToString();
+                    if (string.IsNullOrWhiteSpace(name)) continue;
 
                     details.Add(new TerritoryDetail
                     {
                         TerritoryId = territoryType.RowId,
                         MapId = map.RowId,
                         SizeFactor = map.SizeFactor,
-                        Name = placeName.Name.ToString()
+                        Name = name
                     });
                 }
                 catch (Exception ex)
@@ -144,5 +144,22 @@ public class TerritoryManager
         }
     }
 
+    /// <summary>
+    /// Gets the area category segment of a territory background path.
+    /// </summary>
+    /// <param name="bgPath">The background path, e.g. "ffxiv/sea_s1/twn/s1t1/level/s1t1".</param>
+    /// <returns>The third path segment (e.g. "twn"), or null if the path has fewer than three segments.</returns>
+    private static string? GetBgCategory(string bgPath)
+    {
+        // Only the third segment is needed, so scan for it instead of splitting the whole path
+        var first = bgPath.IndexOf('/');
+        if (first < 0) return null;
+
+        var second = bgPath.IndexOf('/', first + 1);
+        if (second < 0) return null;
+
+        var third = bgPath.IndexOf('/', second + 1);
+        return third < 0 ? bgPath[(second + 1)..] : bgPath[(second + 1)..third];
+    }
 
 }